@@ -1,6 +1,6 @@
 """Air-To-Air (DeviceType=0) device definition."""
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 from pymelcloud.device import EFFECTIVE_FLAGS, Device
 from pymelcloud.client import Client
@@ -20,30 +20,30 @@ OPERATION_MODE_FAN_ONLY = "fan_only"
 OPERATION_MODE_HEAT_COOL = "heat_cool"
 OPERATION_MODE_UNDEFINED = "undefined"
 
-_OPERATION_MODE_LOOKUP = {
-    1: OPERATION_MODE_HEAT,
-    2: OPERATION_MODE_DRY,
-    3: OPERATION_MODE_COOL,
-    7: OPERATION_MODE_FAN_ONLY,
-    8: OPERATION_MODE_HEAT_COOL,
+# Indexed by the MELCloud integer value, None marks unused values.
+_OPERATION_MODE_LOOKUP: List[Optional[str]] = [
+    None,
+    OPERATION_MODE_HEAT,  # 1
+    OPERATION_MODE_DRY,  # 2
+    OPERATION_MODE_COOL,  # 3
+    None,
+    None,
+    None,
+    OPERATION_MODE_FAN_ONLY,  # 7
+    OPERATION_MODE_HEAT_COOL,  # 8
+]
+_REVERSE_OPERATION_MODE_LOOKUP = {
+    value: key for key, value in enumerate(_OPERATION_MODE_LOOKUP) if value is not None
 }
 
-_OPERATION_MODE_MIN_TEMP_LOOKUP = {
-    OPERATION_MODE_HEAT: "MinTempHeat",
-    OPERATION_MODE_DRY: "MinTempCoolDry",
-    OPERATION_MODE_COOL: "MinTempCoolDry",
-    OPERATION_MODE_FAN_ONLY: "MinTempHeat",  # Fake it just in case.
-    OPERATION_MODE_HEAT_COOL: "MinTempAutomatic",
-    OPERATION_MODE_UNDEFINED: "MinTempHeat",
-}
-
-_OPERATION_MODE_MAX_TEMP_LOOKUP = {
-    OPERATION_MODE_HEAT: "MaxTempHeat",
-    OPERATION_MODE_DRY: "MaxTempCoolDry",
-    OPERATION_MODE_COOL: "MaxTempCoolDry",
-    OPERATION_MODE_FAN_ONLY: "MaxTempHeat",  # Fake it just in case.
-    OPERATION_MODE_HEAT_COOL: "MaxTempAutomatic",
-    OPERATION_MODE_UNDEFINED: "MaxTempHeat",
+# Device conf keys of the (min, max) target temperature for each operation mode.
+_OPERATION_MODE_TEMP_BOUNDS_LOOKUP = {
+    OPERATION_MODE_HEAT: ("MinTempHeat", "MaxTempHeat"),
+    OPERATION_MODE_DRY: ("MinTempCoolDry", "MaxTempCoolDry"),
+    OPERATION_MODE_COOL: ("MinTempCoolDry", "MaxTempCoolDry"),
+    OPERATION_MODE_FAN_ONLY: ("MinTempHeat", "MaxTempHeat"),  # Fake it just in case.
+    OPERATION_MODE_HEAT_COOL: ("MinTempAutomatic", "MaxTempAutomatic"),
+    OPERATION_MODE_UNDEFINED: ("MinTempHeat", "MaxTempHeat"),
 }
 
 V_VANE_POSITION_AUTO = "auto"
@@ -67,77 +67,234 @@ H_VANE_POSITION_SWING = "swing"
 H_VANE_POSITION_UNDEFINED = "undefined"
 
 
-def _fan_speed_from(speed: int) -> str:
-    if speed == 0:
-        return FAN_SPEED_AUTO
+def _list_lookup(table: List[Optional[str]], index: Optional[int], default: str) -> str:
+    # Match the dict lookups these tables replaced: integral floats such as 3.0
+    # are valid indices, anything else falls back to the default.
+    if index is None:
+        return default
+    try:
+        position = int(index)
+    except (TypeError, ValueError, OverflowError):
+        return default
+    if position != index or not 0 <= position < len(table):
+        return default
+    return table[position] or default
+
+
+_FAN_SPEED_LOOKUP = [FAN_SPEED_AUTO] + [str(speed) for speed in range(1, 11)]
+_REVERSE_FAN_SPEED_LOOKUP = {value: key for key, value in enumerate(_FAN_SPEED_LOOKUP)}
+
+
+def _fan_speed_from(speed: Optional[int]) -> str:
+    if isinstance(speed, int) and 0 <= speed < len(_FAN_SPEED_LOOKUP):
+        return _FAN_SPEED_LOOKUP[speed]
     return str(speed)
 
 
 def _fan_speed_to(speed: str) -> int:
-    if speed == FAN_SPEED_AUTO:
-        return 0
-    return int(speed)
+    value = _REVERSE_FAN_SPEED_LOOKUP.get(speed)
+    if value is not None:
+        return value
+    value = int(speed)
+    if value < 0:
+        raise ValueError(f"Invalid fan_speed [{speed}]")
+    return value
 
 
-def _operation_mode_from(mode: int) -> str:
-    return _OPERATION_MODE_LOOKUP.get(mode, OPERATION_MODE_UNDEFINED)
+def _operation_mode_from(mode: Optional[int]) -> str:
+    return _list_lookup(_OPERATION_MODE_LOOKUP, mode, OPERATION_MODE_UNDEFINED)
 
 
 def _operation_mode_to(mode: str) -> int:
-    for k, value in _OPERATION_MODE_LOOKUP.items():
-        if value == mode:
-            return k
-    raise ValueError(f"Invalid operation_mode [{mode}]")
-
-
-_H_VANE_POSITION_LOOKUP = {
-    0: H_VANE_POSITION_AUTO,
-    1: H_VANE_POSITION_1,
-    2: H_VANE_POSITION_2,
-    3: H_VANE_POSITION_3,
-    4: H_VANE_POSITION_4,
-    5: H_VANE_POSITION_5,
-    8: H_VANE_POSITION_SPLIT,
-    12: H_VANE_POSITION_SWING,
+    try:
+        return _REVERSE_OPERATION_MODE_LOOKUP[mode]
+    except KeyError:
+        raise ValueError(f"Invalid operation_mode [{mode}]") from None
+
+
+_H_VANE_POSITION_LOOKUP: List[Optional[str]] = [
+    H_VANE_POSITION_AUTO,  # 0
+    H_VANE_POSITION_1,  # 1
+    H_VANE_POSITION_2,  # 2
+    H_VANE_POSITION_3,  # 3
+    H_VANE_POSITION_4,  # 4
+    H_VANE_POSITION_5,  # 5
+    None,
+    None,
+    H_VANE_POSITION_SPLIT,  # 8
+    None,
+    None,
+    None,
+    H_VANE_POSITION_SWING,  # 12
+]
+_REVERSE_H_VANE_POSITION_LOOKUP = {
+    value: key for key, value in enumerate(_H_VANE_POSITION_LOOKUP) if value is not None
 }
 
 
-def _horizontal_vane_from(position: int) -> str:
-    return _H_VANE_POSITION_LOOKUP.get(position, H_VANE_POSITION_UNDEFINED)
+def _horizontal_vane_from(position: Optional[int]) -> str:
+    return _list_lookup(_H_VANE_POSITION_LOOKUP, position, H_VANE_POSITION_UNDEFINED)
 
 
 def _horizontal_vane_to(position: str) -> int:
-    for k, value in _H_VANE_POSITION_LOOKUP.items():
-        if value == position:
-            return k
-    raise ValueError(f"Invalid horizontal vane position [{position}]")
-
-
-_V_VANE_POSITION_LOOKUP = {
-    0: V_VANE_POSITION_AUTO,
-    1: V_VANE_POSITION_1,
-    2: V_VANE_POSITION_2,
-    3: V_VANE_POSITION_3,
-    4: V_VANE_POSITION_4,
-    5: V_VANE_POSITION_5,
-    7: V_VANE_POSITION_SWING,
+    try:
+        return _REVERSE_H_VANE_POSITION_LOOKUP[position]
+    except KeyError:
+        raise ValueError(f"Invalid horizontal vane position [{position}]") from None
+
+
+_V_VANE_POSITION_LOOKUP: List[Optional[str]] = [
+    V_VANE_POSITION_AUTO,  # 0
+    V_VANE_POSITION_1,  # 1
+    V_VANE_POSITION_2,  # 2
+    V_VANE_POSITION_3,  # 3
+    V_VANE_POSITION_4,  # 4
+    V_VANE_POSITION_5,  # 5
+    None,
+    V_VANE_POSITION_SWING,  # 7
+]
+_REVERSE_V_VANE_POSITION_LOOKUP = {
+    value: key for key, value in enumerate(_V_VANE_POSITION_LOOKUP) if value is not None
 }
 
 
-def _vertical_vane_from(position: int) -> str:
-    return _V_VANE_POSITION_LOOKUP.get(position, V_VANE_POSITION_UNDEFINED)
+def _vertical_vane_from(position: Optional[int]) -> str:
+    return _list_lookup(_V_VANE_POSITION_LOOKUP, position, V_VANE_POSITION_UNDEFINED)
 
 
 def _vertical_vane_to(position: str) -> int:
-    for k, value in _V_VANE_POSITION_LOOKUP.items():
-        if value == position:
-            return k
-    raise ValueError(f"Invalid vertical vane position [{position}]")
+    try:
+        return _REVERSE_V_VANE_POSITION_LOOKUP[position]
+    except KeyError:
+        raise ValueError(f"Invalid vertical vane position [{position}]") from None
+
+
+# Operation modes in display order with the Device capability gating each of them.
+_OPERATION_MODE_CAPABILITIES: Tuple[Tuple[str, Optional[str]], ...] = (
+    (OPERATION_MODE_HEAT, "CanHeat"),
+    (OPERATION_MODE_DRY, "CanDry"),
+    (OPERATION_MODE_COOL, "CanCool"),
+    (OPERATION_MODE_FAN_ONLY, None),
+    (OPERATION_MODE_HEAT_COOL, "ModelSupportsAuto"),
+)
+
+_H_VANE_POSITIONS = (
+    H_VANE_POSITION_AUTO,  # ModelSupportsAuto could affect this.
+    H_VANE_POSITION_1,
+    H_VANE_POSITION_2,
+    H_VANE_POSITION_3,
+    H_VANE_POSITION_4,
+    H_VANE_POSITION_5,
+    H_VANE_POSITION_SPLIT,
+)
+_H_VANE_POSITIONS_WITH_SWING = _H_VANE_POSITIONS + (H_VANE_POSITION_SWING,)
+
+_V_VANE_POSITIONS = (
+    V_VANE_POSITION_AUTO,  # ModelSupportsAuto could affect this.
+    V_VANE_POSITION_1,
+    V_VANE_POSITION_2,
+    V_VANE_POSITION_3,
+    V_VANE_POSITION_4,
+    V_VANE_POSITION_5,
+)
+_V_VANE_POSITIONS_WITH_SWING = _V_VANE_POSITIONS + (V_VANE_POSITION_SWING,)
+
+
+def _operation_modes(
+    _device_conf: Dict[str, Any], device: Mapping[str, Any]
+) -> Tuple[str, ...]:
+    return tuple(
+        mode
+        for mode, capability in _OPERATION_MODE_CAPABILITIES
+        if capability is None or device.get(capability, False)
+    )
+
+
+def _fan_speeds(has_auto: bool, num_fan_speeds: int) -> List[str]:
+    end = max(num_fan_speeds, 0) + 1
+    speeds = _FAN_SPEED_LOOKUP[:end] if has_auto else _FAN_SPEED_LOOKUP[1:end]
+    speeds += [str(num) for num in range(len(_FAN_SPEED_LOOKUP), end)]
+    return speeds
+
+
+def _vane_positions(
+    device_conf: Dict[str, Any],
+    device: Mapping[str, Any],
+    supported: str,
+    positions: Tuple[str, ...],
+    positions_with_swing: Tuple[str, ...],
+) -> Tuple[str, ...]:
+    if device_conf.get("HideVaneControls", False):
+        return ()
+    if not device.get(supported, False):
+        return ()
+    if device.get("SwingFunction", False):
+        return positions_with_swing
+    return positions
+
+
+def _vane_horizontal_positions(
+    device_conf: Dict[str, Any], device: Mapping[str, Any]
+) -> Tuple[str, ...]:
+    return _vane_positions(
+        device_conf,
+        device,
+        "ModelSupportsVaneHorizontal",
+        _H_VANE_POSITIONS,
+        _H_VANE_POSITIONS_WITH_SWING,
+    )
+
+
+def _vane_vertical_positions(
+    device_conf: Dict[str, Any], device: Mapping[str, Any]
+) -> Tuple[str, ...]:
+    return _vane_positions(
+        device_conf,
+        device,
+        "ModelSupportsVaneVertical",
+        _V_VANE_POSITIONS,
+        _V_VANE_POSITIONS_WITH_SWING,
+    )
+
+
+class _DecodedState(NamedTuple):
+    operation_mode: str
+    fan_speed: str
+    vane_horizontal: str
+    vane_vertical: str
+
+
+def _decode_state(state: Dict[str, Any]) -> _DecodedState:
+    return _DecodedState(
+        operation_mode=_operation_mode_from(state.get("OperationMode")),
+        fan_speed=_fan_speed_from(state.get("SetFanSpeed")),
+        vane_horizontal=_horizontal_vane_from(state.get("VaneHorizontal")),
+        vane_vertical=_vertical_vane_from(state.get("VaneVertical")),
+    )
+
+
+# Property -> (state field, effective flag, value converter). Target temperature
+# has no converter, it is rounded to the temperature increment of the device.
+_WRITE_LOOKUP: Dict[str, Tuple[str, int, Optional[Callable[[Any], Any]]]] = {
+    PROPERTY_TARGET_TEMPERATURE: ("SetTemperature", 0x04, None),
+    PROPERTY_OPERATION_MODE: ("OperationMode", 0x02, _operation_mode_to),
+    PROPERTY_FAN_SPEED: ("SetFanSpeed", 0x08, _fan_speed_to),
+    PROPERTY_VANE_HORIZONTAL: ("VaneHorizontal", 0x100, _horizontal_vane_to),
+    PROPERTY_VANE_VERTICAL: ("VaneVertical", 0x10, _vertical_vane_to),
+}
 
 
 class AtaDevice(Device):
     """Air-to-Air device."""
 
+    __slots__ = (
+        "last_energy_value",
+        "_capabilities",
+        "_capabilities_conf",
+        "_decoded_state",
+        "_decoded_state_source",
+    )
+
     def __init__(
         self,
         device_conf: Dict[str, Any],
@@ -147,38 +304,68 @@ class AtaDevice(Device):
         """Initialize an ATA device."""
         super().__init__(device_conf, client, set_debounce)
         self.last_energy_value = None
+        self._capabilities: Dict[str, Tuple[str, ...]] = {}
+        self._capabilities_conf: Optional[Dict[str, Any]] = None
+        self._decoded_state: Optional[_DecodedState] = None
+        self._decoded_state_source: Optional[Dict[str, Any]] = None
 
     def apply_write(self, state: Dict[str, Any], key: str, value: Any):
         """Apply writes to state object.
 
         Used for property validation, do not modify device state.
         """
-        flags = state.get(EFFECTIVE_FLAGS, 0)
-
-        if key == PROPERTY_TARGET_TEMPERATURE:
-            state["SetTemperature"] = self.round_temperature(value)
-            flags = flags | 0x04
-        elif key == PROPERTY_OPERATION_MODE:
-            state["OperationMode"] = _operation_mode_to(value)
-            flags = flags | 0x02
-        elif key == PROPERTY_FAN_SPEED:
-            state["SetFanSpeed"] = _fan_speed_to(value)
-            flags = flags | 0x08
-        elif key == PROPERTY_VANE_HORIZONTAL:
-            state["VaneHorizontal"] = _horizontal_vane_to(value)
-            flags = flags | 0x100
-        elif key == PROPERTY_VANE_VERTICAL:
-            state["VaneVertical"] = _vertical_vane_to(value)
-            flags = flags | 0x10
+        try:
+            field, flag, convert = _WRITE_LOOKUP[key]
+        except KeyError:
+            raise ValueError(f"Cannot set {key}, invalid property") from None
+
+        if convert is None:
+            state[field] = self.round_temperature(value)
         else:
-            raise ValueError(f"Cannot set {key}, invalid property")
+            state[field] = convert(value)
+        try:
+            flags = state[EFFECTIVE_FLAGS]
+        except KeyError:
+            flags = 0
+        if flags & flag != flag:
+            state[EFFECTIVE_FLAGS] = flags | flag
+
+    def _capability(
+        self,
+        key: str,
+        build: Callable[[Dict[str, Any], Mapping[str, Any]], Tuple[str, ...]],
+    ) -> List[str]:
+        """Return a capability list derived from the device conf.
+
+        The results are cached until Device.update replaces the device conf. The cache
+        is keyed on the identity of the conf dict, so edits made to it in place are
+        not picked up.
+        """
+        if self._capabilities_conf is not self._device_conf:
+            self._capabilities_conf = self._device_conf
+            self._capabilities = {}
 
-        state[EFFECTIVE_FLAGS] = flags
+        values = self._capabilities.get(key)
+        if values is None:
+            values = self._capabilities[key] = build(self._device_conf, self._device())
+        return list(values)
+
+    def _decoded(self, state: Dict[str, Any]) -> _DecodedState:
+        """Return the enum values of the state decoded to their string form.
+
+        The values are decoded once per state object fetched or written. The cache
+        is keyed on the identity of the state dict, so _state must be replaced, never
+        mutated in place.
+        """
+        if self._decoded_state is None or state is not self._decoded_state_source:
+            self._decoded_state_source = state
+            self._decoded_state = _decode_state(state)
+        return self._decoded_state
 
     @property
     def has_energy_consumed_meter(self) -> bool:
         """Return True if the device has an energy consumption meter."""
-        return self._device_conf.get("Device", {}).get("HasEnergyConsumedMeter", False)
+        return self._device().get("HasEnergyConsumedMeter", False)
 
     @property
     def total_energy_consumed(self) -> Optional[float]:
@@ -189,7 +376,7 @@ class AtaDevice(Device):
         """
         if self._device_conf is None:
             return None
-        device = self._device_conf.get("Device", {})
+        device = self._device()
         value = device.get("CurrentEnergyConsumed", None)
         if value is None:
             return None
@@ -219,52 +406,36 @@ class AtaDevice(Device):
         """Return target temperature set precision."""
         return self.temperature_increment
 
+    def _target_temperature_bounds(self) -> Tuple[float, float]:
+        min_key, max_key = _OPERATION_MODE_TEMP_BOUNDS_LOOKUP[self.operation_mode]
+        device = self._device()
+        return device.get(min_key, 10), device.get(max_key, 31)
+
     @property
     def target_temperature_min(self) -> Optional[float]:
-        """Return maximum target temperature for the currently active operation mode."""
+        """Return minimum target temperature for the currently active operation mode."""
         if self._state is None:
             return None
-        return self._device_conf.get("Device", {}).get(
-            _OPERATION_MODE_MIN_TEMP_LOOKUP.get(self.operation_mode), 10
-        )
+        return self._target_temperature_bounds()[0]
 
     @property
     def target_temperature_max(self) -> Optional[float]:
         """Return maximum target temperature for the currently active operation mode."""
         if self._state is None:
             return None
-        return self._device_conf.get("Device", {}).get(
-            _OPERATION_MODE_MAX_TEMP_LOOKUP.get(self.operation_mode), 31
-        )
+        return self._target_temperature_bounds()[1]
 
     @property
     def operation_mode(self) -> str:
         """Return currently active operation mode."""
         if self._state is None:
             return OPERATION_MODE_UNDEFINED
-        return _operation_mode_from(self._state.get("OperationMode", -1))
+        return self._decoded(self._state).operation_mode
 
     @property
     def operation_modes(self) -> List[str]:
         """Return available operation modes."""
-        modes: List[str] = []
-
-        conf_dev = self._device_conf.get("Device", {})
-        if conf_dev.get("CanHeat", False):
-            modes.append(OPERATION_MODE_HEAT)
-
-        if conf_dev.get("CanDry", False):
-            modes.append(OPERATION_MODE_DRY)
-
-        if conf_dev.get("CanCool", False):
-            modes.append(OPERATION_MODE_COOL)
-
-        modes.append(OPERATION_MODE_FAN_ONLY)
-
-        if conf_dev.get("ModelSupportsAuto", False):
-            modes.append(OPERATION_MODE_HEAT_COOL)
-
-        return modes
+        return self._capability("operation_modes", _operation_modes)
 
     @property
     def fan_speed(self) -> Optional[str]:
@@ -274,7 +445,7 @@ class AtaDevice(Device):
         """
         if self._state is None:
             return None
-        return _fan_speed_from(self._state.get("SetFanSpeed"))
+        return self._decoded(self._state).fan_speed
 
     @property
     def fan_speeds(self) -> Optional[List[str]]:
@@ -298,74 +469,34 @@ class AtaDevice(Device):
         """
         if self._state is None:
             return None
-        speeds = []
-        if self._device_conf.get("Device", {}).get("HasAutomaticFanSpeed", False):
-            speeds.append(FAN_SPEED_AUTO)
-
-        num_fan_speeds = self._state.get("NumberOfFanSpeeds", 0)
-        for num in range(1, num_fan_speeds + 1):
-            speeds.append(_fan_speed_from(num))
-
-        return speeds
+        return _fan_speeds(
+            self._device().get("HasAutomaticFanSpeed", False),
+            self._state.get("NumberOfFanSpeeds", 0),
+        )
 
     @property
     def vane_horizontal(self) -> Optional[str]:
         """Return horizontal vane position."""
         if self._state is None:
             return None
-        return _horizontal_vane_from(self._state.get("VaneHorizontal"))
+        return self._decoded(self._state).vane_horizontal
 
     @property
     def vane_horizontal_positions(self) -> Optional[List[str]]:
         """Return available horizontal vane positions."""
-        if self._device_conf.get("HideVaneControls", False):
-            return []
-        device = self._device_conf.get("Device", {})
-        if not device.get("ModelSupportsVaneHorizontal", False):
-            return []
-
-        positions = [
-            H_VANE_POSITION_AUTO,  # ModelSupportsAuto could affect this.
-            H_VANE_POSITION_1,
-            H_VANE_POSITION_2,
-            H_VANE_POSITION_3,
-            H_VANE_POSITION_4,
-            H_VANE_POSITION_5,
-            H_VANE_POSITION_SPLIT,
-        ]
-        if device.get("SwingFunction", False):
-            positions.append(H_VANE_POSITION_SWING)
-
-        return positions
+        return self._capability("vane_horizontal_positions", _vane_horizontal_positions)
 
     @property
     def vane_vertical(self) -> Optional[str]:
         """Return vertical vane position."""
         if self._state is None:
             return None
-        return _vertical_vane_from(self._state.get("VaneVertical"))
+        return self._decoded(self._state).vane_vertical
 
     @property
     def vane_vertical_positions(self) -> Optional[List[str]]:
         """Return available vertical vane positions."""
-        if self._device_conf.get("HideVaneControls", False):
-            return []
-        device = self._device_conf.get("Device", {})
-        if not device.get("ModelSupportsVaneVertical", False):
-            return []
-
-        positions = [
-            V_VANE_POSITION_AUTO,  # ModelSupportsAuto could affect this.
-            V_VANE_POSITION_1,
-            V_VANE_POSITION_2,
-            V_VANE_POSITION_3,
-            V_VANE_POSITION_4,
-            V_VANE_POSITION_5,
-        ]
-        if device.get("SwingFunction", False):
-            positions.append(V_VANE_POSITION_SWING)
-
-        return positions
+        return self._capability("vane_vertical_positions", _vane_vertical_positions)
 
     @property
     def actual_fan_speed(self) -> Optional[str]:
@@ -376,4 +507,4 @@ class AtaDevice(Device):
         """
         if self._state is None:
             return None
-        return str(self._device_conf.get("Device", {}).get("ActualFanSpeed", -1))
+        return str(self._device().get("ActualFanSpeed", -1))
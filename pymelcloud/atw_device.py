@@ -292,6 +292,8 @@ class Zone:
 class AtwDevice(Device):
     """Air-to-Water device."""
 
+    __slots__ = ()
+
     def apply_write(self, state: Dict[str, Any], key: str, value: Any):
         """Apply writes to state object."""
         flags = state.get(EFFECTIVE_FLAGS, 0)
@@ -391,7 +393,7 @@ class AtwDevice(Device):
         """
         _zones = []
 
-        device = self._device_conf.get("Device", {})
+        device = self._device()
         if device.get("HasThermostatZone1", False):
             _zones.append(Zone(self, lambda: self._state, lambda: self._device_conf, 1))
 
@@ -3,7 +3,8 @@ import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from pymelcloud.client import Client
 from pymelcloud.const import (
@@ -19,10 +20,31 @@ PROPERTY_POWER = "power"
 EFFECTIVE_FLAGS = "EffectiveFlags"
 HAS_PENDING_COMMAND = "HasPendingCommand"
 
+# Shared read-only fallback for a missing "Device" entry.
+_EMPTY_DEVICE: Mapping[str, Any] = MappingProxyType({})
+
 
 class Device(ABC):
     """MELCloud base device representation."""
 
+    __slots__ = (
+        "device_id",
+        "building_id",
+        "mac",
+        "serial",
+        "access_level",
+        "_use_fahrenheit",
+        "_device_conf",
+        "_state",
+        "_device_units",
+        "_client",
+        "_set_debounce",
+        "_set_event",
+        "_write_task",
+        "_pending_writes",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         device_conf: Dict[str, Any],
@@ -40,7 +62,12 @@ class Device(ABC):
         if client.account is not None:
             self._use_fahrenheit = client.account.get("UseFahrenheit", False)
 
+        # Replaced with a new dict by update(), never mutated in place. Subclasses
+        # cache capabilities derived from the conf by the identity of this dict, so
+        # in place edits are not reflected in them.
         self._device_conf = device_conf
+        # Always replaced with a new dict, never mutated in place. Subclasses cache
+        # values derived from the state by the identity of this dict.
         self._state = None
         self._device_units = None
         self._client = client
@@ -50,10 +77,12 @@ class Device(ABC):
         self._write_task: Optional[asyncio.Future[None]] = None
         self._pending_writes: Dict[str, Any] = {}
 
+    def _device(self) -> Mapping[str, Any]:
+        return self._device_conf.get("Device", _EMPTY_DEVICE)
+
     def get_device_prop(self, name: str) -> Optional[Any]:
         """Access device properties while shortcutting the nested device access."""
-        device = self._device_conf.get("Device", {})
-        return device.get(name)
+        return self._device().get(name)
 
     def get_state_prop(self, name: str) -> Optional[Any]:
         """Access state prop without None check."""
@@ -142,7 +171,7 @@ class Device(ABC):
     def device_type(self) -> str:
         """Return type of the device."""
         return DEVICE_TYPE_LOOKUP.get(
-            self._device_conf.get("Device", {}).get("DeviceType", -1),
+            self._device().get("DeviceType", -1),
             DEVICE_TYPE_UNKNOWN,
         )
 
@@ -173,7 +202,7 @@ class Device(ABC):
     @property
     def temperature_increment(self) -> float:
         """Return temperature increment."""
-        return self._device_conf.get("Device", {}).get("TemperatureIncrement", 0.5)
+        return self._device().get("TemperatureIncrement", 0.5)
 
     @property
     def last_seen(self) -> Optional[datetime]:
@@ -199,7 +228,7 @@ class Device(ABC):
         """Return wifi signal in dBm (negative value)."""
         if self._device_conf is None:
             return None
-        return self._device_conf.get("Device", {}).get("WifiSignalStrength", None)
+        return self._device().get("WifiSignalStrength", None)
 
     @property
     def has_error(self) -> bool:
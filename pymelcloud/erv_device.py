@@ -51,6 +51,8 @@ def _ventilation_mode_to(mode: str) -> int:
 class ErvDevice(Device):
     """Energy-Recovery-Ventilation device."""
 
+    __slots__ = ()
+
     def apply_write(self, state: Dict[str, Any], key: str, value: Any):
         """Apply writes to state object.
 
@@ -69,9 +71,6 @@ class ErvDevice(Device):
 
         state[EFFECTIVE_FLAGS] = flags
 
-    def _device(self) -> Dict[str, Any]:
-        return self._device_conf.get("Device", {})
-
     @property
     def has_energy_consumed_meter(self) -> bool:
         """Return True if the device has an energy consumption meter."""
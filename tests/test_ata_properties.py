@@ -79,6 +79,8 @@ async def test_ata():
     assert device.target_temperature == 22.0
 
     assert device.operation_mode == OPERATION_MODE_COOL
+    assert device.target_temperature_min == 16.0
+    assert device.target_temperature_max == 31.0
     assert device.fan_speed == "3"
     assert device.actual_fan_speed == "0"
     assert device.fan_speeds == ["auto", "1", "2", "3", "4", "5"]
@@ -98,3 +100,80 @@ async def test_ata_guest():
     assert device.device_type == DEVICE_TYPE_ATA
     assert device.access_level == ACCESS_LEVEL["GUEST"]
     await device.update()
+
+
+def test_ata_apply_write():
+    device = _build_device("ata_listdevice.json", "ata_get.json")
+
+    state = {}
+    device.apply_write(state, "target_temperature", 21.3)
+    device.apply_write(state, "operation_mode", OPERATION_MODE_HEAT_COOL)
+    device.apply_write(state, "fan_speed", "auto")
+    device.apply_write(state, "vane_horizontal", H_VANE_POSITION_SWING)
+    device.apply_write(state, "vane_vertical", V_VANE_POSITION_SWING)
+
+    assert state == {
+        "SetTemperature": 21.5,
+        "OperationMode": 8,
+        "SetFanSpeed": 0,
+        "VaneHorizontal": 12,
+        "VaneVertical": 7,
+        "EffectiveFlags": 0x11E,
+    }
+
+    with pytest.raises(ValueError):
+        device.apply_write({}, "operation_mode", "invalid")
+    with pytest.raises(ValueError):
+        device.apply_write({}, "vane_horizontal", H_VANE_POSITION_UNDEFINED)
+    with pytest.raises(ValueError):
+        device.apply_write({}, "vane_vertical", V_VANE_POSITION_UNDEFINED)
+    with pytest.raises(ValueError):
+        device.apply_write({}, "fan_speed", "-1")
+    with pytest.raises(ValueError):
+        device.apply_write({}, "invalid", 1)
+
+
+@pytest.mark.asyncio
+async def test_ata_capabilities_follow_device_conf():
+    device = _build_device("ata_listdevice.json", "ata_get.json")
+    await device.update()
+    assert OPERATION_MODE_HEAT_COOL in device.operation_modes
+
+    # The device conf is replaced, not edited in place, when it changes.
+    device_conf = dict(device._device_conf)
+    device_conf["Device"] = dict(device_conf["Device"], ModelSupportsAuto=False)
+    device._client.device_confs.__iter__ = Mock(return_value=[device_conf].__iter__())
+    await device.update()
+
+    assert device._device_conf is device_conf
+    assert OPERATION_MODE_HEAT_COOL not in device.operation_modes
+
+
+@pytest.mark.asyncio
+async def test_ata_decoded_state_follows_state():
+    device = _build_device("ata_listdevice.json", "ata_get.json")
+    await device.update()
+
+    assert device.operation_mode == OPERATION_MODE_COOL
+    assert device.fan_speed == "3"
+    assert device.vane_horizontal == H_VANE_POSITION_3
+    assert device.vane_vertical == V_VANE_POSITION_AUTO
+
+    device._client.device_confs.__iter__ = Mock(
+        return_value=[device._device_conf].__iter__()
+    )
+    device._client.fetch_device_state = CoroutineMock(
+        return_value={
+            **device._state,
+            "OperationMode": 1,
+            "SetFanSpeed": 0,
+            "VaneHorizontal": 12,
+            "VaneVertical": 7,
+        }
+    )
+    await device.update()
+
+    assert device.operation_mode == OPERATION_MODE_HEAT
+    assert device.fan_speed == "auto"
+    assert device.vane_horizontal == H_VANE_POSITION_SWING
+    assert device.vane_vertical == V_VANE_POSITION_SWING
@@ -1,5 +1,7 @@
 """Device tests."""
 
+import weakref
+
 import pytest
 from pymelcloud.ata_device import AtaDevice
 from .util import build_device
@@ -39,3 +41,10 @@ async def test_round_temperature():
     assert device.round_temperature(25.49999) == 25.0
     assert device.round_temperature(25.5) == 26.0
 
+
+def test_device_slots():
+    device = _build_device("ata_listdevice.json", "ata_get.json")
+
+    assert weakref.ref(device)() is device
+    with pytest.raises(AttributeError):
+        device.unknown_attribute = 1